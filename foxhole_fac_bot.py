@@ -2,9 +2,25 @@ import discord
 from discord.ext import commands, tasks
 from discord.ui import View, Button
 from discord import app_commands
+import asyncio
+from collections import Counter
+from contextvars import ContextVar
 from datetime import datetime, timezone, time
+import functools
+import hashlib
+import heapq
 import json
+import operator
 import os
+import stat
+import sys
+import tempfile
+import time as time_module
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is missing
+    orjson = None
 
 # ============================================================
 # CONFIGURATION
@@ -15,9 +31,23 @@ USER_FILE = "users.json"
 DASH_FILE = "dashboard.json"
 ORDERS_FILE = "orders.json"
 CONTRIB_FILE = "contributions.json"
+ORDERS_LOG_FILE = "orders_log.jsonl"
+ORDERS_LOG_ROTATED = "orders_log.jsonl.compacting"  # log being folded into ORDERS_FILE
+SYNC_FILE = "command_sync.json"
 SUPPLY_INCREMENT_Dunne = 1500
 SUPPLY_INCREMENT_Stowheel = 6000
 
+ORDER_STATUSES = tuple(map(sys.intern, (
+    "Order Placed",
+    "Order Claimed",
+    "Order Started",
+    "In Progress",
+    "Ready for Collection",
+    "Complete",
+)))
+VALID_ORDER_STATUSES = frozenset(ORDER_STATUSES)
+VALID_ORDER_STATUSES_MSG = ", ".join(ORDER_STATUSES)
+
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
@@ -28,6 +58,27 @@ TOKEN = os.getenv("DISCORD_TOKEN")
 if not TOKEN:
     raise ValueError("❌ No DISCORD_TOKEN found in environment variables.")
 
+# ============================================================
+# INTERACTION CLOCK
+# ============================================================
+
+_interaction_now: ContextVar[datetime | None] = ContextVar("interaction_now", default=None)
+
+def utc_now() -> datetime:
+    """Current UTC time, frozen for the duration of a @with_now command."""
+    return _interaction_now.get() or datetime.now(timezone.utc)
+
+def with_now(func):
+    """Pin utc_now() to a single clock read for the whole command handler."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _interaction_now.set(datetime.now(timezone.utc))
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _interaction_now.reset(token)
+    return wrapper
+
 # ============================================================
 # ARCHIVE SYSTEM
 # ============================================================
@@ -43,7 +94,7 @@ def create_war_archive_folder(timestamp_str: str) -> Path:
 
 def export_json(path: Path, data: dict):
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+        f.write(json.dumps(data, indent=4))
 
 def generate_markdown_report(
     path: Path,
@@ -79,26 +130,113 @@ def generate_markdown_report(
 # DATA MANAGEMENT
 # ============================================================
 
+def decode_data(raw: bytes):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def encode_data(data) -> bytes:
+    # Compact on purpose: these files are machine-read; archives use export_json
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
 def load_data(file, default):
-    if os.path.exists(file):
-        with open(file, "r") as f:
-            return json.load(f)
-    return default
+    try:
+        with open(file, "rb") as f:
+            return decode_data(f.read())
+    except FileNotFoundError:
+        return default
+
+_UMASK = os.umask(0)  # read once at import, while nothing else is running
+os.umask(_UMASK)
+
+def write_file(file, payload: bytes):
+    """Write via a temp file + os.replace so a crash never leaves truncated JSON."""
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(file)),
+        prefix=f"{os.path.basename(file)}.",
+        suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        # mkstemp creates 0600; keep the file's existing mode (or a normal open()'s)
+        try:
+            mode = stat.S_IMODE(os.stat(file).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp, mode)
+        os.replace(tmp, file)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
 
 def save_data(file, data):
-    with open(file, "w") as f:
-        json.dump(data, f, indent=4)
+    _pending_saves.pop(file, None)  # superseded by this immediate write
+    write_file(file, encode_data(data))
+
+# ------------------------------------------------------------
+# Debounced saves: mutators queue a file, flush_saves_loop writes it
+# ------------------------------------------------------------
+_pending_saves: dict[str, object] = {}  # file → data awaiting write
+
+def mark_dirty(file, data):
+    """Queue `data` to be written to `file` on the next flush tick."""
+    _pending_saves[file] = data
+
+def flush_pending_saves():
+    """Synchronously write everything still queued (used at shutdown)."""
+    while _pending_saves:
+        file, data = _pending_saves.popitem()
+        write_file(file, encode_data(data))
+
+def intern_order_fields(order: dict):
+    """Share one str object per status/priority value across all orders."""
+    for key in ("status", "priority"):
+        if isinstance(order.get(key), str):
+            order[key] = sys.intern(order[key])
+
+def append_order_event(event: dict):
+    with open(ORDERS_LOG_FILE, "ab") as f:
+        f.write(encode_data(event) + b"\n")
+
+def replay_order_events(data: dict, path: str = ORDERS_LOG_FILE) -> dict:
+    """Apply order events appended to `path` since the last snapshot."""
+    if not os.path.exists(path):
+        return data
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                event = decode_data(line)
+            except json.JSONDecodeError:
+                continue  # torn append from a crash
+            op = event.get("op")
+            if op == "snapshot":
+                data = event["data"]
+            elif op == "set":
+                data.setdefault("orders", {})[event["id"]] = event["order"]
+                data["next_id"] = event.get("next_id", data.get("next_id", 1))
+            elif op == "delete":
+                data.get("orders", {}).pop(event["id"], None)
+    return data
 
 def load_orders():
+    """Load the orders snapshot, then replay the event log on top of it."""
+    data = {"next_id": 1, "orders": {}}
     if os.path.exists(ORDERS_FILE):
-        with open(ORDERS_FILE, "r") as f:
+        with open(ORDERS_FILE, "rb") as f:
             try:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-            except json.JSONDecodeError:
+                snapshot = decode_data(f.read())
+                if isinstance(snapshot, dict):
+                    data = snapshot
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
                 pass
-    return {"next_id": 1, "orders": {}}
+    # A rotated log left by an interrupted compaction holds the older events
+    data = replay_order_events(data, ORDERS_LOG_ROTATED)
+    data = replay_order_events(data, ORDERS_LOG_FILE)
+    for order in data.get("orders", {}).values():
+        intern_order_fields(order)
+    return data
 
 # Ensure data files exist
 for file, default in [
@@ -111,7 +249,7 @@ for file, default in [
         save_data(file, default)
 
 tunnels = load_data(DATA_FILE, {})
-users = load_data(USER_FILE, {})
+users = Counter(load_data(USER_FILE, {}))  # user_id → supplies contributed
 dashboard_info = load_data(DASH_FILE, {})  # {guild_id: {"channel": id, "message": id}}
 contributions = load_data(CONTRIB_FILE, {})
 
@@ -194,17 +332,29 @@ def find_tunnel(tunnel_name: str):
     return None, None
 
 
+_channel_facility_index: dict[str, dict[int, str]] = {}  # guild → {tunnel_channel: facility}
+
+
+def invalidate_channel_index(guild_id: str | None = None):
+    """Forget the channel → facility index after a dashboard is created, moved or wiped."""
+    if guild_id is None:
+        _channel_facility_index.clear()
+    else:
+        _channel_facility_index.pop(guild_id, None)
+
+
 def get_facility_for_channel(guild_id: str, channel_id: int) -> str | None:
     """
     Given a guild + channel/thread id, return the facility bound to that dashboard,
     or None if this channel is not the home dashboard for any facility.
+    The index covers every facility, so misses are answered without a scan.
     """
-    info = dashboard_info.get(guild_id, {})
-    facilities = info.get("facilities", {})
-    for fname, fdata in facilities.items():
-        if fdata.get("tunnel_channel") == channel_id:
-            return fname
-    return None
+    index = _channel_facility_index.get(guild_id)
+    if index is None:
+        index = _channel_facility_index[guild_id] = {}
+        for name, fdata in dashboard_info.get(guild_id, {}).get("facilities", {}).items():
+            index.setdefault(fdata.get("tunnel_channel"), name)
+    return index.get(channel_id)
 
 async def tunnel_name_autocomplete_impl(
     interaction: discord.Interaction,
@@ -260,6 +410,7 @@ def normalize_dashboard_info():
         "orders_channel": int,
         "orders_message": int,
         "log_channel": int,
+        "log_thread": int,
         "leaderboard_channel": int,
     }
 
@@ -307,45 +458,46 @@ def normalize_dashboard_info():
             info["facilities"] = facilities
 
     if changed:
-        save_data(DASH_FILE, dashboard_info)
+        mark_dirty(DASH_FILE, dashboard_info)
 
 def catch_up_tunnels():
     """
     Apply offline usage decay if the bot was down for a while.
-    Uses per-facility nested tunnel structure.
+    Uses per-facility nested tunnel structure. `last_updated_ts` is a POSIX
+    timestamp; legacy ISO `last_updated` strings are migrated on first pass.
     """
-    now = datetime.now(timezone.utc)
+    now_ts = time_module.time()
     updated = False
 
-    for facility_name, facility_data in tunnels.items():
+    for facility_data in tunnels.values():
         tun_dict = facility_data.get("tunnels", {})
 
-        for tunnel_name, tdata in tun_dict.items():
+        for tdata in tun_dict.values():
             usage = tdata.get("usage_rate", 0)
-            last_str = tdata.get("last_updated")
+            last_ts = tdata.get("last_updated_ts")
 
-            if not last_str:
-                tdata["last_updated"] = now.isoformat()
-                continue
-
-            try:
-                last = datetime.fromisoformat(last_str)
-            except Exception:
-                tdata["last_updated"] = now.isoformat()
-                continue
+            if last_ts is None:
+                legacy = tdata.pop("last_updated", None)
+                updated = True
+                try:
+                    last_ts = datetime.fromisoformat(legacy).timestamp()
+                except (TypeError, ValueError):
+                    tdata["last_updated_ts"] = now_ts
+                    continue
 
-            hours_passed = (now - last).total_seconds() / 3600
+            hours_passed = (now_ts - last_ts) / 3600
 
             if hours_passed > 0 and usage > 0:
                 tdata["total_supplies"] = max(
                     0,
                     tdata.get("total_supplies", 0) - (usage * hours_passed)
                 )
-                tdata["last_updated"] = now.isoformat()
+                last_ts = now_ts
                 updated = True
+            tdata["last_updated_ts"] = last_ts
 
     if updated:
-        save_data(DATA_FILE, tunnels)
+        mark_dirty(DATA_FILE, tunnels)
 
 # ============================================================
 # HYBRID FACILITY NORMALIZATION (Phase 5 — Step 3A)
@@ -406,14 +558,75 @@ def normalize_all_facilities():
             if normalize_facility_record(fac_name, fac_record):
                 changed = True
     if changed:
-        save_data(DASH_FILE, dashboard_info)
+        mark_dirty(DASH_FILE, dashboard_info)
 
 # ============================================================
 # GLOBAL PERMISSIONS SYSTEM
 # ============================================================
 
+AUTHORIZED_ROLE_NAMES = frozenset({"Verified™"})
+AUTH_CACHE_TTL = 5.0  # seconds
+_auth_cache: dict[tuple[int, tuple[int, ...]], tuple[float, bool]] = {}
+
+
 def has_authorized_role(member: discord.Member):
-    return any(r.name == "Verified™" for r in member.roles)
+    """
+    True if the member holds an authorized role.
+    Results are cached briefly per (member, role ids), so repeated clicks
+    skip resolving and scanning `member.roles`; a role change alters the key.
+    """
+    role_ids = getattr(member, "_roles", None)
+    if role_ids is None:
+        return False  # plain User (e.g. DMs) has no roles
+
+    key = (member.id, tuple(role_ids))
+    now = time_module.monotonic()
+    cached = _auth_cache.get(key)
+    if cached and now - cached[0] < AUTH_CACHE_TTL:
+        return cached[1]
+
+    allowed = not AUTHORIZED_ROLE_NAMES.isdisjoint(r.name for r in member.roles)
+    if len(_auth_cache) > 1000:
+        _auth_cache.clear()
+    _auth_cache[key] = (now, allowed)
+    return allowed
+
+
+TUNNEL_MANAGER_ROLE_NAMES = frozenset({"Officer", "NCO", "Facility Specialist"})
+
+
+def is_tunnel_manager(member: discord.Member | None) -> bool:
+    """True if the member may manage tunnels and facility dashboards."""
+    if not isinstance(member, discord.Member):
+        return False
+    return not TUNNEL_MANAGER_ROLE_NAMES.isdisjoint(r.name for r in member.roles)
+
+
+_officer_role_ids: dict[int, int] = {}  # guild_id → Officer role id
+
+
+def get_officer_role(guild: discord.Guild) -> discord.Role | None:
+    """Officer role lookup; the role id is cached so repeat calls skip the role scan."""
+    role_id = _officer_role_ids.get(guild.id)
+    if role_id is not None:
+        role = guild.get_role(role_id)
+        if role is not None and role.name == "Officer":
+            return role
+
+    role = discord.utils.get(guild.roles, name="Officer")
+    if role is None:
+        _officer_role_ids.pop(guild.id, None)
+    else:
+        _officer_role_ids[guild.id] = role.id
+    return role
+
+
+def is_officer(guild: discord.Guild, member: discord.Member | discord.User) -> bool:
+    """Officer check by role id (Member.get_role searches the member's sorted role ids)."""
+    officer_role = get_officer_role(guild)
+    if not officer_role or not isinstance(member, discord.Member):
+        return False
+    return member.get_role(officer_role.id) is not None
 
 
 async def interaction_role_guard(interaction: discord.Interaction):
@@ -448,6 +661,51 @@ async def global_permission_lock(ctx: commands.Context):
 
     raise commands.CheckFailure("🚫 You do not have permission to use this command.")
 
+# ============================================================
+# USER LOOKUP
+# ============================================================
+
+USER_CACHE_MAX = 500
+_user_cache: dict[int, discord.User] = {}  # uid → User fetched over REST
+
+
+async def resolve_users(
+    user_ids,
+    guild: discord.Guild | None = None
+) -> dict[int, discord.User | discord.Member | None]:
+    """
+    Resolve user ids cache-first (guild members, our cache, then the client cache).
+    Misses are fetched from the API concurrently; failures map to None.
+    """
+    resolved: dict[int, discord.User | discord.Member | None] = {}
+    missing = []
+    for uid in set(user_ids):
+        user = (
+            (guild.get_member(uid) if guild else None)
+            or _user_cache.get(uid)
+            or bot.get_user(uid)
+        )
+        if user:
+            resolved[uid] = user
+        else:
+            missing.append(uid)
+
+    if missing:
+        fetched = await asyncio.gather(
+            *(bot.fetch_user(uid) for uid in missing),
+            return_exceptions=True
+        )
+        for uid, user in zip(missing, fetched):
+            if isinstance(user, Exception):
+                resolved[uid] = None
+                continue
+            if len(_user_cache) >= USER_CACHE_MAX:
+                _user_cache.pop(next(iter(_user_cache)))
+            _user_cache[uid] = user
+            resolved[uid] = user
+
+    return resolved
+
 # ============================================================
 # DATA LOGGING — Unified System (A2 Format)
 # ============================================================
@@ -457,9 +715,10 @@ def format_log(
     action: str,
     target: str | None = None,
     details: str | None = None,
+    ts: datetime | None = None,
 ):
     """Return a perfectly formatted log line according to A2 standard."""
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    timestamp = (ts or utc_now()).strftime("%Y-%m-%d %H:%M:%S UTC")
 
     base = f"🧾 `{timestamp}` — {actor.display_name} {action}"
 
@@ -472,10 +731,24 @@ def format_log(
     return base
 
 
+_log_thread_cache: dict[int, discord.Thread] = {}  # guild_id → FAC Logs thread
+
+
 async def get_fac_log_thread(guild: discord.Guild):
-    """Returns the FAC Logs thread, creating it if missing."""
-    guild_id = str(guild.id)
-    log_channel_id = dashboard_info.get(guild_id, {}).get("log_channel")
+    """
+    Returns the FAC Logs thread, creating it if missing.
+    The thread id is stored as `log_thread` so a restart can find it again
+    with a cache lookup instead of scanning the channel's threads.
+    """
+    cached = _log_thread_cache.get(guild.id)
+    if cached is not None:
+        # A deleted thread drops out of the guild but is never marked archived
+        if guild.get_thread(cached.id) is cached and not cached.archived:
+            return cached
+        del _log_thread_cache[guild.id]
+
+    info = dashboard_info.get(str(guild.id), {})
+    log_channel_id = info.get("log_channel")
     if not log_channel_id:
         return None
 
@@ -483,35 +756,53 @@ async def get_fac_log_thread(guild: discord.Guild):
     if not log_channel:
         return None
 
-    # Find existing thread
-    thread = discord.utils.get(log_channel.threads, name="FAC Logs")
-    if thread:
-        return thread
+    # Known thread id first, then find existing thread by name
+    thread = log_channel.get_thread(info["log_thread"]) if info.get("log_thread") else None
+    if not thread or thread.archived:
+        thread = discord.utils.get(log_channel.threads, name="FAC Logs")
 
-    # Create thread if missing
-    thread = await log_channel.create_thread(
-        name="FAC Logs",
-        type=discord.ChannelType.public_thread
-    )
-    await thread.send("🧾 **FAC Audit Log Thread Created**")
+    if not thread or thread.archived:
+        # Create thread if missing
+        thread = await log_channel.create_thread(
+            name="FAC Logs",
+            type=discord.ChannelType.public_thread
+        )
+        await thread.send("🧾 **FAC Audit Log Thread Created**")
+
+    if info.get("log_thread") != thread.id:
+        info["log_thread"] = thread.id
+        mark_dirty(DASH_FILE, dashboard_info)
+    _log_thread_cache[guild.id] = thread
     return thread
 
 
 # ------------------------------------------------------------
 # BATCHING for SUPPLY ADDITIONS ONLY
 # ------------------------------------------------------------
+SUPPLY_LOG_ACTIONS = frozenset({
+    "added supplies",
+    "submitted stacks",
+    "1500 added",
+    "supply added",
+    "stack submission",
+})
 log_buffer = {}  # (guild_id, user_id, tunnel_name, date) → {amount, last_action}
 
 
 async def flush_supply_logs():
     """Flushes batched supply submissions immediately."""
     now = datetime.now(timezone.utc)
+    if not log_buffer:
+        return
+
+    # One concurrent lookup for every buffered contributor
+    resolved = await resolve_users(key[1] for key in log_buffer)
 
     for key, entry in list(log_buffer.items()):
         guild_id, user_id, tunnel_name, date_key = key
         amount = entry["amount"]
 
-        guild = discord.utils.get(bot.guilds, id=guild_id)
+        guild = bot.get_guild(guild_id)
         if not guild:
             continue
 
@@ -519,7 +810,11 @@ async def flush_supply_logs():
         if not thread:
             continue
 
-        user = guild.get_member(user_id) or await bot.fetch_user(user_id)
+        user = guild.get_member(user_id) or resolved.get(user_id)
+        if user is None:
+            print(f"[WARN] Dropping supply log for unknown user {user_id}")
+            del log_buffer[key]
+            continue
 
         line = format_log(
             actor=user,
@@ -528,7 +823,11 @@ async def flush_supply_logs():
             details=f"{amount:,} total today"
         )
 
-        await thread.send(line)
+        try:
+            await thread.send(line)
+        except discord.NotFound:
+            _log_thread_cache.pop(guild_id, None)  # keep the entry for the next flush
+            continue
         del log_buffer[key]
 
 
@@ -542,8 +841,12 @@ async def log_action(
     target_name: str | None = None,
     amount: int | None = None,
     details: str | None = None,
+    ts: datetime | None = None,
 ):
-    """Universal logger for tunnels, orders, and admin actions."""
+    """
+    Universal logger for tunnels, orders, and admin actions.
+    Pass `ts` when the caller already read the clock for this action.
+    """
 
     try:
         # Get logging location
@@ -554,20 +857,14 @@ async def log_action(
         # ------------------------------------------------------------
         # SUPPLY ACTION? → batch it
         # ------------------------------------------------------------
-        is_supply = action.lower() in [
-            "added supplies",
-            "submitted stacks",
-            "1500 added",
-            "supply added",
-            "stack submission",
-        ]
+        is_supply = action.lower() in SUPPLY_LOG_ACTIONS
 
         if is_supply:
             key = (
                 guild.id,
                 actor.id,
                 target_name,
-                datetime.now(timezone.utc).strftime("%Y-%m-%d")
+                (ts or utc_now()).strftime("%Y-%m-%d")
             )
 
             if key not in log_buffer:
@@ -585,17 +882,23 @@ async def log_action(
             actor=actor,
             action=action,
             target=target_name,
-            details=details
+            details=details,
+            ts=ts
         )
         await thread.send(line)
 
+    except discord.NotFound as e:
+        _log_thread_cache.pop(guild.id, None)  # thread gone; look it up again next time
+        print(f"[LOGGING ERROR] {e}")
     except Exception as e:
         print(f"[LOGGING ERROR] {e}")
        
+CONTRIBUTION_ACTIONS = frozenset({"add supplies", "submit stacks", "1500 (done)"})  # count toward totals
+
 def log_contribution(user_id: str, action: str, amount: int | float = 0, tunnel: str | None = None):
     """Record player contributions for analytics."""
     user_id = str(user_id)
-    now = datetime.now(timezone.utc).isoformat()
+    now = utc_now().isoformat()
 
     if user_id not in contributions:
         contributions[user_id] = {
@@ -604,7 +907,7 @@ def log_contribution(user_id: str, action: str, amount: int | float = 0, tunnel:
         }
 
     # Add to running totals if relevant
-    if action.lower() in ["add supplies", "submit stacks", "1500 (done)"]:
+    if action.lower() in CONTRIBUTION_ACTIONS:
 
         contributions[user_id]["total_supplies"] += amount
 
@@ -616,7 +919,7 @@ def log_contribution(user_id: str, action: str, amount: int | float = 0, tunnel:
         "amount": amount
     })
 
-    save_data(CONTRIB_FILE, contributions)
+    mark_dirty(CONTRIB_FILE, contributions)
 
 class StackSubmitModal(discord.ui.Modal, title="Submit Stacks"):
     tunnel_name: str
@@ -632,7 +935,16 @@ class StackSubmitModal(discord.ui.Modal, title="Submit Stacks"):
         self.add_item(self.amount)
 
     async def on_submit(self, interaction: discord.Interaction):
-        stacks = int(self.amount.value)
+        try:
+            stacks = int(self.amount.value.strip())
+        except ValueError:
+            stacks = 0
+        if stacks <= 0:
+            await interaction.response.send_message(
+                "❌ Enter a whole number of stacks greater than zero.",
+                ephemeral=True
+            )
+            return
         amount = stacks * 100
 
         guild_id = str(interaction.guild.id)
@@ -668,9 +980,9 @@ class StackSubmitModal(discord.ui.Modal, title="Submit Stacks"):
         tdata["total_supplies"] = tdata.get("total_supplies", 0) + amount
 
         user_id = str(interaction.user.id)
-        users[user_id] = users.get(user_id, 0) + amount
-        save_data(DATA_FILE, tunnels)
-        save_data(USER_FILE, users)
+        users[user_id] += amount
+        mark_dirty(DATA_FILE, tunnels)
+        mark_dirty(USER_FILE, users)
 
         log_contribution(interaction.user.id, "submit stacks", amount, self.tunnel_name)
         await log_action(
@@ -681,11 +993,11 @@ class StackSubmitModal(discord.ui.Modal, title="Submit Stacks"):
             amount=amount
         )
 
-        await refresh_dashboard(interaction.guild, facility_name)
         await interaction.response.send_message(
             f"🪣 Submitted {amount} supplies ({stacks} stacks) to **{self.tunnel_name}**.",
             ephemeral=True
         )
+        schedule_dashboard_refresh(interaction.guild, facility_name)
 
 class BulkTunnelUpdateModal(discord.ui.Modal):
     def __init__(self, facility_name: str, user: discord.User):
@@ -711,16 +1023,14 @@ class BulkTunnelUpdateModal(discord.ui.Modal):
     async def on_submit(self, interaction: discord.Interaction):
         now = datetime.now(timezone.utc)
 
-        facility = get_facility_tunnels(self.facility_name)
-        if not facility:
+        fac_tunnels = get_facility_tunnels(self.facility_name)
+        if not fac_tunnels:
             await interaction.response.send_message(
                 "❌ Facility not found.",
                 ephemeral=True
             )
             return
 
-        tunnels = get_facility_tunnels(self.facility_name)
-
         updated = []
         skipped = []
         errors = []
@@ -742,7 +1052,7 @@ class BulkTunnelUpdateModal(discord.ui.Modal):
 
             name = parts[0]
 
-            if name not in tunnels:
+            if name not in fac_tunnels:
                 skipped.append(name)
                 continue
 
@@ -760,11 +1070,12 @@ class BulkTunnelUpdateModal(discord.ui.Modal):
                     errors.append(line)
                     continue
 
-            tunnel = tunnels[name]
+            tunnel = fac_tunnels[name]
 
             # Priority: observed supply value
             tunnel["total_supplies"] = supplies
             tunnel["last_verified_at"] = now.isoformat()
+            tunnel["last_updated_ts"] = now.timestamp()  # observed now; nothing to replay
 
             if usage is not None:
                 tunnel["usage_rate"] = usage
@@ -780,10 +1091,12 @@ class BulkTunnelUpdateModal(discord.ui.Modal):
                 details=(
                     f"Supplies={'set to ' + str(supplies) if supplies is not None else 'unchanged'}, "
                     f"Usage={'set to ' + str(usage) if usage is not None else 'unchanged'}"
-                )
+                ),
+                ts=now
             )
-        
-        save_data(DASH_FILE, dashboard_info)
+
+        if updated:
+            mark_dirty(DATA_FILE, tunnels)
 
         await interaction.response.send_message(
             "✅ Update complete\n\n"
@@ -819,7 +1132,7 @@ class TunnelButton(Button):
         async def dunne_callback(interaction: discord.Interaction):
 
             user_id = str(interaction.user.id)
-            users[user_id] = users.get(user_id, 0) + SUPPLY_INCREMENT_Dunne
+            users[user_id] += SUPPLY_INCREMENT_Dunne
             guild_id = str(interaction.guild.id)
             channel_id = interaction.channel.id
 
@@ -851,8 +1164,8 @@ class TunnelButton(Button):
                 return
 
             tdata["total_supplies"] = tdata.get("total_supplies", 0) + SUPPLY_INCREMENT_Dunne
-            save_data(DATA_FILE, tunnels)
-            save_data(USER_FILE, users)
+            mark_dirty(DATA_FILE, tunnels)
+            mark_dirty(USER_FILE, users)
 
             log_contribution(interaction.user.id, "1500 (Done)", SUPPLY_INCREMENT_Dunne, self.tunnel)
             await log_action(
@@ -863,16 +1176,16 @@ class TunnelButton(Button):
                 amount=SUPPLY_INCREMENT_Dunne
             )
 
-            await refresh_dashboard(interaction.guild, facility_name)
             await interaction.response.edit_message(
                 content=f"🪣 Added {SUPPLY_INCREMENT_Dunne} supplies to **{self.tunnel}**!",
                 view=None
             )
+            schedule_dashboard_refresh(interaction.guild, facility_name)
 
         async def Stowheel_callback(interaction: discord.Interaction):
 
             user_id = str(interaction.user.id)
-            users[user_id] = users.get(user_id, 0) + SUPPLY_INCREMENT_Stowheel
+            users[user_id] += SUPPLY_INCREMENT_Stowheel
             guild_id = str(interaction.guild.id)
             channel_id = interaction.channel.id
 
@@ -904,8 +1217,8 @@ class TunnelButton(Button):
                 return
 
             tdata["total_supplies"] = tdata.get("total_supplies", 0) + SUPPLY_INCREMENT_Stowheel
-            save_data(DATA_FILE, tunnels)
-            save_data(USER_FILE, users)
+            mark_dirty(DATA_FILE, tunnels)
+            mark_dirty(USER_FILE, users)
 
             log_contribution(interaction.user.id, "1500 (Done)", SUPPLY_INCREMENT_Stowheel, self.tunnel)
             await log_action(
@@ -916,11 +1229,11 @@ class TunnelButton(Button):
                 amount=SUPPLY_INCREMENT_Stowheel
             )
 
-            await refresh_dashboard(interaction.guild, facility_name)
             await interaction.response.edit_message(
                 content=f"🪣 Added {SUPPLY_INCREMENT_Stowheel} supplies to **{self.tunnel}**!",
                 view=None
             )
+            schedule_dashboard_refresh(interaction.guild, facility_name)
 
 
         async def stack_callback(interaction: discord.Interaction):
@@ -949,12 +1262,37 @@ class DashboardPaginator(discord.ui.View):
     def __init__(self, tunnels, facility_name: str | None = None, per_page=8):
         super().__init__(timeout=None)
         self.facility_name = facility_name
-        self.tunnels = list(tunnels.items())
         self.per_page = per_page
         self.page = 0
+        self.nav_buttons = [
+            discord.ui.Button(label="⏮️", style=discord.ButtonStyle.gray, custom_id="nav_first", row=0),
+            discord.ui.Button(label="◀️", style=discord.ButtonStyle.gray, custom_id="nav_prev", row=0),
+            discord.ui.Button(label="▶️", style=discord.ButtonStyle.gray, custom_id="nav_next", row=0),
+            discord.ui.Button(label="⏭️", style=discord.ButtonStyle.gray, custom_id="nav_last", row=0),
+        ]
+        self.tunnel_buttons: dict[str, TunnelButton] = {}  # buttons on the current page
+        self.set_tunnels(tunnels)
+
+    def set_tunnels(self, tunnels: dict):
+        """Point the view at the latest tunnel dict and refresh only changed buttons."""
+        self.tunnels = list(tunnels.items())
         self.total_pages = max(1, -(-len(self.tunnels) // self.per_page))
+        self.page = min(self.page, self.total_pages - 1)
         self.build_page_buttons()
 
+    def page_signature(self) -> tuple:
+        """The values build_page_embed renders for the current page, timestamp aside."""
+        start = self.page * self.per_page
+        return (
+            self.facility_name,
+            self.page,
+            self.total_pages,
+            tuple(
+                (name, int(data.get("total_supplies", 0)), int(data.get("usage_rate", 0)))
+                for name, data in self.tunnels[start:start + self.per_page]
+            ),
+        )
+
     # -----------------------------------------
     # Build the embed for the current page
     # -----------------------------------------
@@ -967,7 +1305,7 @@ class DashboardPaginator(discord.ui.View):
         embed = discord.Embed(
             title=title,
             color=0x00ff99,
-            timestamp=datetime.now(timezone.utc)
+            timestamp=utc_now()
         )
 
         start = self.page * self.per_page
@@ -1005,26 +1343,32 @@ class DashboardPaginator(discord.ui.View):
     # Rebuild tunnel buttons dynamically
     # -----------------------------------------
     def build_page_buttons(self):
-        """Clear and rebuild tunnel buttons for current page."""
+        """
+        Lay out buttons for the current page.
+        Navigation buttons and TunnelButtons still on the page are reused;
+        only tunnels new to the page get a freshly allocated button.
+        Skipped entirely when the page shows the same tunnels as last time.
+        """
+        start = self.page * self.per_page
+        end = start + self.per_page
+        page_items = self.tunnels[start:end]
+        if self.children and tuple(self.tunnel_buttons) == tuple(name for name, _ in page_items):
+            return
+
         self.clear_items()
 
         # navigation buttons
-        nav_buttons = [
-            discord.ui.Button(label="⏮️", style=discord.ButtonStyle.gray, custom_id="nav_first", row=0),
-            discord.ui.Button(label="◀️", style=discord.ButtonStyle.gray, custom_id="nav_prev", row=0),
-            discord.ui.Button(label="▶️", style=discord.ButtonStyle.gray, custom_id="nav_next", row=0),
-            discord.ui.Button(label="⏭️", style=discord.ButtonStyle.gray, custom_id="nav_last", row=0),
-        ]
-        for b in nav_buttons:
+        for b in self.nav_buttons:
             self.add_item(b)
 
         # tunnel buttons for visible subset
-        start = self.page * self.per_page
-        end = start + self.per_page
         tunnels_per_row = 4
-        for i, (name, _) in enumerate(self.tunnels[start:end]):
-            button = TunnelButton(name)
+        previous = self.tunnel_buttons
+        self.tunnel_buttons = {}
+        for i, (name, _) in enumerate(page_items):
+            button = previous.get(name) or TunnelButton(name)
             button.row = 1 + (i // tunnels_per_row)
+            self.tunnel_buttons[name] = button
             self.add_item(button)
 
     # -----------------------------------------
@@ -1056,6 +1400,19 @@ class DashboardPaginator(discord.ui.View):
 
         return True
 
+_dashboard_views: dict[tuple[str, str], DashboardPaginator] = {}  # (guild_id, facility) → live view
+
+
+def get_dashboard_view(guild_id: str, facility_name: str, fac_tunnels: dict) -> DashboardPaginator:
+    """Return the facility's live dashboard view, updated in place if it already exists."""
+    key = (guild_id, facility_name)
+    view = _dashboard_views.get(key)
+    if view is None:
+        view = _dashboard_views[key] = DashboardPaginator(fac_tunnels, facility_name=facility_name)
+    else:
+        view.set_tunnels(fac_tunnels)
+    return view
+
 class MsuppDashboardModal(discord.ui.Modal, title="Create MSUPP Facility"):
     def __init__(self, suggested_name: str, channel_id: int, guild_id: int):
         super().__init__(title="Create MSUPP Facility")
@@ -1084,7 +1441,7 @@ class MsuppDashboardModal(discord.ui.Modal, title="Create MSUPP Facility"):
         info = dashboard_info[guild_id_str]
         facilities = info.setdefault("facilities", {})
 
-        paginator = DashboardPaginator(fac_tunnels, facility_name=facility_name)
+        paginator = get_dashboard_view(guild_id_str, facility_name, fac_tunnels)
         msg = await channel.send(embed=paginator.build_page_embed(), view=paginator)
 
         facilities[facility_name] = {
@@ -1093,12 +1450,13 @@ class MsuppDashboardModal(discord.ui.Modal, title="Create MSUPP Facility"):
         }
         info["facilities"] = facilities
         dashboard_info[guild_id_str] = info
+        invalidate_channel_index(guild_id_str)
         normalize_facility_record(
             facility_name,
             facilities[facility_name],
             creator_id=interaction.user.id
         )
-        save_data(DASH_FILE, dashboard_info)
+        mark_dirty(DASH_FILE, dashboard_info)
 
         await interaction.response.send_message(
             f"✅ MSUPP dashboard for **{facility_name}** created in {channel.mention}.",
@@ -1151,25 +1509,28 @@ def build_dashboard_embed():
     embed.set_footer(text="🕒 Updated every 2 minutes.")
     return embed
 
-async def refresh_msupp_dashboard(guild: discord.Guild, facility_name: str):
-    """Edit or recreate the persistent tunnel dashboard message for a single facility."""
+_rendered_signatures: dict[tuple[str, str], tuple] = {}  # (guild_id, facility) → last pushed page
+
+
+async def refresh_msupp_dashboard(guild: discord.Guild, facility_name: str, force: bool = False):
+    """
+    Edit or recreate the persistent tunnel dashboard message for a single facility.
+    The edit (and the embed build) is skipped when the visible page values
+    match the last ones pushed, unless `force` is set.
+    """
     guild_id = str(guild.id)
     info = dashboard_info.get(guild_id, {})
     facilities = info.get("facilities", {})
     fac_cfg = facilities.get(facility_name)
 
-    # Update facility metadata
-    fac_cfg["last_refresh"] = datetime.now(timezone.utc).isoformat()
-    save_data(DASH_FILE, dashboard_info)
-
-    # Normalize facility structure before building UI
-    if normalize_facility_record(facility_name, fac_cfg):
-        save_data(DASH_FILE, dashboard_info)
-
     if not fac_cfg:
         print(f"[INFO] No facility '{facility_name}' dashboard info for guild {guild.name}")
         return
 
+    # Normalize facility structure before building UI
+    if normalize_facility_record(facility_name, fac_cfg):
+        mark_dirty(DASH_FILE, dashboard_info)
+
     channel_id = fac_cfg.get("tunnel_channel")
     msg_id = fac_cfg.get("tunnel_message")
 
@@ -1187,24 +1548,37 @@ async def refresh_msupp_dashboard(guild: discord.Guild, facility_name: str):
         facilities[facility_name] = fac_cfg
         info["facilities"] = facilities
         dashboard_info[guild_id] = info
-        save_data(DASH_FILE, dashboard_info)
+        invalidate_channel_index(guild_id)
+        mark_dirty(DASH_FILE, dashboard_info)
 
         return
 
     facility_tunnels = get_facility_tunnels(facility_name)
-    paginator = DashboardPaginator(facility_tunnels, facility_name=facility_name)
+    paginator = get_dashboard_view(guild_id, facility_name, facility_tunnels)
+
+    render_key = (guild_id, facility_name)
+    signature = paginator.page_signature()
+    if not force and _rendered_signatures.get(render_key) == signature:
+        return  # nothing visible changed since the last edit
+    embed = paginator.build_page_embed()
 
     try:
-        msg = await channel.fetch_message(msg_id)
-        await msg.edit(embed=paginator.build_page_embed(), view=paginator)
+        msg = channel.get_partial_message(msg_id)
+        await msg.edit(embed=embed, view=paginator)
+        _rendered_signatures[render_key] = signature
+        fac_cfg["last_refresh"] = utc_now().isoformat()
+        mark_dirty(DASH_FILE, dashboard_info)
     except discord.NotFound:
-        new_msg = await channel.send(embed=paginator.build_page_embed(), view=paginator)
+        new_msg = await channel.send(embed=embed, view=paginator)
+        _rendered_signatures[render_key] = signature
         fac_cfg["tunnel_channel"] = new_msg.channel.id
         fac_cfg["tunnel_message"] = new_msg.id
+        fac_cfg["last_refresh"] = utc_now().isoformat()
         facilities[facility_name] = fac_cfg
         info["facilities"] = facilities
         dashboard_info[guild_id] = info
-        save_data(DASH_FILE, dashboard_info)
+        invalidate_channel_index(guild_id)
+        mark_dirty(DASH_FILE, dashboard_info)
         print(f"[RECOVERY] Dashboard for facility '{facility_name}' recreated in {guild.name}")
     except Exception as inner_e:
         print(f"[FATAL] Could not recreate dashboard for facility '{facility_name}' in {guild.name}: {inner_e}")
@@ -1226,10 +1600,62 @@ async def refresh_dashboard(guild: discord.Guild, facility_name: str | None = No
     for fname in facilities.keys():
         await refresh_msupp_dashboard(guild, fname)
 
+
+DASHBOARD_REFRESH_DEBOUNCE = 2  # seconds; clicks inside the window share one edit
+_pending_refreshes: dict[tuple[int, str | None], asyncio.Task] = {}  # (guild, facility) → task
+
+
+def schedule_dashboard_refresh(guild: discord.Guild, facility_name: str | None = None):
+    """Queue a dashboard refresh; repeated calls within the window coalesce into one edit."""
+    key = (guild.id, facility_name)
+    if key in _pending_refreshes:
+        return
+
+    async def run():
+        # The task copied the caller's context; drop a @with_now clock pinned
+        # by the command so the refresh stamps the time it actually runs
+        _interaction_now.set(None)
+        await asyncio.sleep(DASHBOARD_REFRESH_DEBOUNCE)
+        _pending_refreshes.pop(key, None)
+        try:
+            await refresh_dashboard(guild, facility_name)
+        except Exception as e:
+            print(f"[ERROR] Debounced dashboard refresh failed for '{facility_name}' in {guild.name}: {e}")
+
+    _pending_refreshes[key] = asyncio.create_task(run())
+
 # ============================================================
 # ORDER DASHBOARD VIEW
 # ============================================================
 
+PRIORITY_ICONS = {"High": "🔴", "Normal": "🟡", "Low": "🟢"}
+PRIORITY_RANK = {"High": 0, "Normal": 1, "Low": 2}
+ORDER_STATUS_ICONS = {
+    "Order Placed": "🕓",
+    "Order Claimed": "🟦",
+    "Order Started": "🧰",
+    "In Progress": "⚙️",
+    "Ready for Collection": "📦",
+    "Complete": "✅"
+}
+
+_sorted_order_ids: tuple[int, tuple[str, ...]] = (-1, ())  # (_orders_version, ids)
+
+
+def sorted_order_ids() -> tuple[str, ...]:
+    """Order ids by priority (High first), then age; re-sorted only after an order mutation."""
+    global _sorted_order_ids
+    version, ids = _sorted_order_ids
+    if version != _orders_version:
+        orders = orders_data["orders"]
+        ids = tuple(sorted(
+            orders,
+            key=lambda oid: (PRIORITY_RANK.get(orders[oid].get("priority"), 1), int(oid))
+        ))
+        _sorted_order_ids = (_orders_version, ids)
+    return ids
+
+
 class OrderActionView(discord.ui.View):
     """Interactive buttons for managing a specific order."""
     def __init__(self, order_id: str):
@@ -1254,6 +1680,48 @@ class OrderActionView(discord.ui.View):
 # ------------------------------------------------------------
 # Dashboard Builder
 # ------------------------------------------------------------
+def format_claimed_name(claimed_by: str | None) -> str:
+    if not claimed_by:
+        return "-"
+    try:
+        claimed_user = bot.get_user(int(claimed_by)) or f"<@{claimed_by}>"
+        return claimed_user.display_name if hasattr(claimed_user, "display_name") else claimed_user
+    except Exception:
+        return "Unknown"
+
+def format_order_summary_row(oid: str, o: dict) -> str:
+    priority = o.get("priority", "Normal")
+    priority_icon = PRIORITY_ICONS.get(priority, "🟢")
+    return (
+        f"**#{oid}** | {o['item']} | {o['quantity']} | {o['status']} | "
+        f"{priority_icon} {priority} | {format_claimed_name(o.get('claimed_by'))}"
+    )
+
+EMBED_DESCRIPTION_LIMIT = 4096  # Discord rejects longer embed descriptions
+
+
+def join_rows_within_limit(rows: list[str], limit: int = EMBED_DESCRIPTION_LIMIT) -> str:
+    """Join rows with newlines, ending in an '…and N more' line if they would overflow `limit`."""
+    text = "\n".join(rows)
+    if len(text) <= limit:
+        return text
+
+    kept, size = [], 0
+    for i, row in enumerate(rows):
+        more = f"…and {len(rows) - i} more"
+        if size + len(row) + 1 + len(more) > limit:
+            kept.append(more)
+            break
+        kept.append(row)
+        size += len(row) + 1
+    return "\n".join(kept)
+
+
+ORDER_SUMMARY_HEADER = (
+    "**ID | Item | Qty | Status | Priority | Claimed By**\n"
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+)
+
 def build_order_dashboard():
     """Build the dashboard embed summarizing all current orders."""
     embed = discord.Embed(
@@ -1266,27 +1734,11 @@ def build_order_dashboard():
         embed.description = "No active orders. Use `/order_create` to start a new one."
         return embed
 
-    header = "**ID | Item | Qty | Status | Priority | Claimed By**\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-    lines = []
-
-    for oid, o in orders_data["orders"].items():
-        status = o["status"]
-        priority = o.get("priority", "Normal")
-        item = o["item"]
-        qty = o["quantity"]
-        claimed = "-"
-        if o.get("claimed_by"):
-            try:
-                claimed_user = bot.get_user(int(o["claimed_by"])) or f"<@{o['claimed_by']}>"
-                claimed = claimed_user.display_name if hasattr(claimed_user, "display_name") else claimed_user
-            except Exception:
-                claimed = "Unknown"
-
-        # Add colored emoji for priority
-        priority_icon = {"High": "🔴", "Normal": "🟡", "Low": "🟢"}.get(priority, "🟢")
-        lines.append(f"**#{oid}** | {item} | {qty} | {status} | {priority_icon} {priority} | {claimed}")
+    lines = [ORDER_SUMMARY_HEADER]
+    orders = orders_data["orders"]
+    lines.extend([format_order_summary_row(oid, orders[oid]) for oid in sorted_order_ids()])
 
-    embed.description = f"{header}\n" + "\n".join(lines)
+    embed.description = join_rows_within_limit(lines)
     embed.set_footer(text="🔁 Updated automatically every 5 minutes.")
     return embed
 
@@ -1310,16 +1762,17 @@ async def refresh_order_dashboard(guild: discord.Guild):
         print(f"[WARN] Orders channel missing for guild {guild.name}.")
         return
 
+    embed = build_clickable_order_dashboard()
     try:
-        msg = await channel.fetch_message(message_id)
-        await msg.edit(embed=build_clickable_order_dashboard(), view=OrderDashboardView())
+        msg = channel.get_partial_message(message_id)
+        await msg.edit(embed=embed, view=get_order_dashboard_view(gid))
         #print(f"[OK] Refreshed order dashboard for {guild.name}.")
     except discord.NotFound:
         # The message was deleted — recreate it
-        new_msg = await channel.send(embed=build_clickable_order_dashboard(), view=OrderDashboardView())
+        new_msg = await channel.send(embed=embed, view=get_order_dashboard_view(gid))
         dashboard_info[gid]["orders_channel"] = channel.id
         dashboard_info[gid]["orders_message"] = new_msg.id
-        save_data(DASH_FILE, dashboard_info)
+        mark_dirty(DASH_FILE, dashboard_info)
         print(f"[INFO] Recreated order dashboard in {channel.name}.")
     except Exception as e:
         print(f"[ERROR] Failed to refresh order dashboard in {guild.name}: {e}")
@@ -1328,9 +1781,18 @@ async def refresh_order_dashboard(guild: discord.Guild):
 # AUTO-REFRESH ORDERS DASHBOARD (every 5 minutes)
 # ============================================================
 
+_orders_rendered_version = -1  # _orders_version last pushed by refresh_orders_loop
+
 @tasks.loop(minutes=5)
 async def refresh_orders_loop():
     """Refresh the interactive orders dashboard every 5 minutes."""
+    global _orders_rendered_version
+    version = _orders_version
+    if _orders_rendered_version == version:
+        return  # no order changed since the last tick
+
+    failed = False
+    embed = None  # orders are global, so one render serves every guild
     for guild in bot.guilds:
         # Look up where the dashboard was last posted
         info = dashboard_info.get(str(guild.id), {})
@@ -1345,16 +1807,23 @@ async def refresh_orders_loop():
             continue
 
         try:
-            msg = await channel.fetch_message(message_id)
-            view = OrderDashboardView()
-            embed = build_clickable_order_dashboard()
+            msg = channel.get_partial_message(message_id)
+            view = get_order_dashboard_view(str(guild.id))
+            if embed is None:
+                embed = build_clickable_order_dashboard()
             await msg.edit(embed=embed, view=view)
         except discord.NotFound:
             # Dashboard message no longer exists
-            continue
+            failed = True
         except Exception as e:
+            failed = True
             print(f"[ORDER DASHBOARD REFRESH ERROR] {e}")
 
+    # Only count the version as rendered once every edit landed; a failed
+    # edit is retried next tick even if no order changes in between
+    if not failed:
+        _orders_rendered_version = version
+
 @refresh_orders_loop.before_loop
 async def before_refresh_orders_loop():
     await bot.wait_until_ready()
@@ -1387,7 +1856,14 @@ class OrderStatusSelect(discord.ui.Select):
 
     async def callback(self, interaction: discord.Interaction):
         """Handle status updates when a selection is made."""
-        new_status = self.values[0]
+        new_status = sys.intern(self.values[0])
+        if new_status not in VALID_ORDER_STATUSES:
+            await interaction.response.send_message(
+                f"⚠️ Invalid status. Choose one of: {VALID_ORDER_STATUSES_MSG}",
+                ephemeral=True
+            )
+            return
+
         order = orders_data["orders"].get(self.order_id)
 
         if not order:
@@ -1398,10 +1874,11 @@ class OrderStatusSelect(discord.ui.Select):
             return
 
         # Update the order record
+        now = utc_now()
         old_status = order.get("status", "Unknown")
         order["status"] = new_status
-        order["timestamps"]["last_update"] = datetime.now(timezone.utc).isoformat()
-        save_orders()
+        order["timestamps"]["last_update"] = now.isoformat()
+        save_orders(self.order_id)
 
         # Log the change
         await log_action(
@@ -1409,7 +1886,8 @@ class OrderStatusSelect(discord.ui.Select):
             interaction.user,
             "updated order status",
             target_name=f"#{self.order_id}",
-            details=f"{old_status} → {new_status}"
+            details=f"{old_status} → {new_status}",
+            ts=now
         )
 
         # Refresh dashboard view
@@ -1428,36 +1906,47 @@ class OrderStatusSelectView(discord.ui.View):
         super().__init__(timeout=60)
         self.add_item(OrderStatusSelect(order_id))
 
+    async def interaction_check(self, interaction: discord.Interaction):
+        if not has_authorized_role(interaction.user):
+            await interaction.response.send_message("🚫 Unauthorized.", ephemeral=True)
+            return False
+        return True
+
 class SingleOrderView(discord.ui.View):
     """Interactive buttons for a single order."""
     def __init__(self, order_id: str):
         super().__init__(timeout=60)
         self.order_id = order_id
 
+    async def interaction_check(self, interaction: discord.Interaction):
+        """Authorize once per click, before any button handler defers."""
+        if not has_authorized_role(interaction.user):
+            await interaction.response.send_message("🚫 Unauthorized.", ephemeral=True)
+            return False
+        return True
+
     @discord.ui.button(label="Claim", style=discord.ButtonStyle.blurple)
     async def claim_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
 
-        if not has_authorized_role(interaction.user):
-            await interaction.followup.send("🚫 Unauthorized.", ephemeral=True)
-            return
-
         order = orders_data["orders"].get(self.order_id)
         if not order:
             await interaction.followup.send(f"❌ Order #{self.order_id} not found.", ephemeral=True)
             return
 
         order["claimed_by"] = str(interaction.user.id)
-        order["status"] = "Order Claimed"
-        order["timestamps"]["claimed"] = datetime.now(timezone.utc).isoformat()
-        save_orders()
+        order["status"] = sys.intern("Order Claimed")
+        now = utc_now()
+        order["timestamps"]["claimed"] = now.isoformat()
+        save_orders(self.order_id)
 
         await log_action(
             interaction.guild,
             interaction.user,
             "claimed order",
             target_name=f"#{self.order_id}",
-            details=f"{order['item']} x{order['quantity']}"
+            details=f"{order['item']} x{order['quantity']}",
+            ts=now
         )
         await refresh_order_dashboard(interaction.guild)
         await interaction.followup.send(f"🛠 Order **#{self.order_id}** claimed successfully.", ephemeral=True)
@@ -1466,10 +1955,6 @@ class SingleOrderView(discord.ui.View):
     @discord.ui.button(label="Update Status", style=discord.ButtonStyle.green)
     async def update_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Opens a dropdown to update order status."""
-        if not has_authorized_role(interaction.user):
-            await interaction.response.send_message("🚫 Unauthorized.", ephemeral=True)
-            return
-
         await interaction.response.send_message(
             "📝 Select a new status from the dropdown below:",
             view=OrderStatusSelectView(self.order_id),
@@ -1480,25 +1965,23 @@ class SingleOrderView(discord.ui.View):
     async def complete_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
 
-        if not has_authorized_role(interaction.user):
-            await interaction.followup.send("🚫 Unauthorized.", ephemeral=True)
-            return
-
         order = orders_data["orders"].get(self.order_id)
         if not order:
             await interaction.followup.send(f"❌ Order #{self.order_id} not found.", ephemeral=True)
             return
 
-        order["status"] = "Complete"
-        order["timestamps"]["completed"] = datetime.now(timezone.utc).isoformat()
-        save_orders()
+        order["status"] = sys.intern("Complete")
+        now = utc_now()
+        order["timestamps"]["completed"] = now.isoformat()
+        save_orders(self.order_id)
 
         await log_action(
             interaction.guild,
             interaction.user,
             "marked order complete",
             target_name=f"#{self.order_id}",
-            details=f"{order['item']} x{order['quantity']}"
+            details=f"{order['item']} x{order['quantity']}",
+            ts=now
         )
 
         await refresh_order_dashboard(interaction.guild)
@@ -1508,8 +1991,7 @@ class SingleOrderView(discord.ui.View):
     async def delete_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
 
-        officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-        if not officer_role or officer_role not in interaction.user.roles:
+        if not is_officer(interaction.guild, interaction.user):
             await interaction.followup.send("🚫 Only Officers can delete orders.", ephemeral=True)
             return
 
@@ -1518,7 +2000,7 @@ class SingleOrderView(discord.ui.View):
             return
 
         deleted = orders_data["orders"].pop(self.order_id)
-        save_orders()
+        save_orders(self.order_id)
 
         await log_action(
             interaction.guild,
@@ -1550,8 +2032,9 @@ class OrderButton(discord.ui.Button):
             return
             
         # Calculate how long ago the order was created
+        now = utc_now()
         created_time = datetime.fromisoformat(order["timestamps"]["created"])
-        elapsed = datetime.now(timezone.utc) - created_time
+        elapsed = now - created_time
         hours_ago = int(elapsed.total_seconds() // 3600)
         minutes_ago = int((elapsed.total_seconds() % 3600) // 60)
         time_str = f"{hours_ago}h {minutes_ago}m ago" if hours_ago > 0 else f"{minutes_ago}m ago"
@@ -1567,31 +2050,97 @@ class OrderButton(discord.ui.Button):
                 f"**Claimed by:** {('<@' + order['claimed_by'] + '>') if order['claimed_by'] else '—'}\n"
                 f"**Placed:** {time_str}"
             ),
-            timestamp=datetime.now(timezone.utc)
+            timestamp=now
         )
 
         await interaction.response.send_message(embed=embed, view=SingleOrderView(self.order_id), ephemeral=True)
 
 
 class OrderDashboardView(discord.ui.View):
-    """Dynamic dashboard view with clickable order buttons."""
-    def __init__(self):
+    """
+    Dynamic dashboard view with clickable order buttons.
+    Paged so a view never exceeds Discord's 25-component limit.
+    """
+    def __init__(self, per_page: int = 20):
         super().__init__(timeout=None)
+        self.per_page = per_page
+        self.page = 0
+        self.nav_buttons = [
+            discord.ui.Button(label="◀️", style=discord.ButtonStyle.gray, custom_id="orders_prev", row=0),
+            discord.ui.Button(label="▶️", style=discord.ButtonStyle.gray, custom_id="orders_next", row=0),
+        ]
+        self._buttons: dict[str, OrderButton] = {}  # order_id → button
         self.build_buttons()
 
     def build_buttons(self):
+        """Sync buttons with the current orders and lay out the current page, reusing existing buttons."""
+        current = orders_data["orders"]
+        for oid in [oid for oid in self._buttons if oid not in current]:
+            del self._buttons[oid]
+
+        order_ids = sorted_order_ids()
+        self.total_pages = max(1, -(-len(order_ids) // self.per_page))
+        self.page = min(self.page, self.total_pages - 1)
+
         self.clear_items()
-        if not orders_data["orders"]:
-            return
+        if self.total_pages > 1:
+            for b in self.nav_buttons:
+                self.add_item(b)
+
+        start = self.page * self.per_page
+        buttons_per_row = 5
+        for i, oid in enumerate(order_ids[start:start + self.per_page]):
+            button = self._buttons.get(oid)
+            if button is None:
+                button = self._buttons[oid] = OrderButton(oid, f"#{oid}")
+            button.row = 1 + (i // buttons_per_row)
+            self.add_item(button)
+
+    async def interaction_check(self, interaction: discord.Interaction):
+        cid = interaction.data.get("custom_id")
+        if cid not in ("orders_prev", "orders_next"):
+            return True
+
+        old_page = self.page
+        if cid == "orders_prev" and self.page > 0:
+            self.page -= 1
+        elif cid == "orders_next" and self.page < self.total_pages - 1:
+            self.page += 1
+
+        if old_page != self.page:
+            self.build_buttons()
+            await interaction.response.edit_message(view=self)
+        else:
+            await interaction.response.defer()
+        return False
+
 
-        for oid, o in orders_data["orders"].items():
-            label = f"#{oid}"
-            self.add_item(OrderButton(oid, label))
+_order_dashboard_views: dict[str, OrderDashboardView] = {}  # guild_id → live view
+
+
+def get_order_dashboard_view(guild_id: str) -> OrderDashboardView:
+    """Return the guild's live order dashboard view, synced with the current orders."""
+    view = _order_dashboard_views.get(guild_id)
+    if view is None:
+        view = _order_dashboard_views[guild_id] = OrderDashboardView()
+    else:
+        view.build_buttons()
+    return view
 
 
 # ============================================================
 # BUILD EMBED (Updated to show clickable buttons)
 # ============================================================
+def format_order_row(oid: str, o: dict) -> str:
+    priority = o.get("priority", "Normal")
+    status = o["status"]
+    claimed_by = o.get("claimed_by")
+    claimed = f"<@{claimed_by}>" if claimed_by else "—"
+    return (
+        f"**#{oid}** {o['item']} x{o['quantity']} | {PRIORITY_ICONS.get(priority, '🟢')} **{priority}** | "
+        f"{ORDER_STATUS_ICONS.get(status, '📋')} {status} | 👤 {claimed}"
+    )
+
 def build_clickable_order_dashboard():
     """Clean, modern order dashboard to match tunnel aesthetic."""
     embed = discord.Embed(
@@ -1604,49 +2153,78 @@ def build_clickable_order_dashboard():
         embed.description = "No active orders. Use `/order_create` to add one."
         return embed
 
-    lines = []
-    for oid, o in orders_data["orders"].items():
-        item = o["item"]
-        qty = o["quantity"]
-        priority = o.get("priority", "Normal")
-        status = o["status"]
-        claimed = f"<@{o['claimed_by']}>" if o.get("claimed_by") else "—"
-
-        priority_icon = {"High": "🔴", "Normal": "🟡", "Low": "🟢"}.get(priority, "🟢")
-        status_icon = {
-            "Order Placed": "🕓",
-            "Order Claimed": "🟦",
-            "Order Started": "🧰",
-            "In Progress": "⚙️",
-            "Ready for Collection": "📦",
-            "Complete": "✅"
-        }.get(status, "📋")
-
-        lines.append(
-            f"**#{oid}** {item} x{qty} | {priority_icon} **{priority}** | "
-            f"{status_icon} {status} | 👤 {claimed}"
-        )
-
-    embed.description = "\n".join(lines)
+    embed.description = join_rows_within_limit(
+        [format_order_row(oid, orders_data["orders"][oid]) for oid in sorted_order_ids()]
+    )
     embed.set_footer(text="💡 Click an Order ID below to manage it.")
     return embed
 
+# ============================================================
+# COMMAND SYNC
+# ============================================================
+
+def command_tree_signature() -> str:
+    """Return a stable hash of the registered slash command definitions."""
+    # to_dict() is the exact payload tree.sync() uploads, so anything Discord
+    # would see (autocomplete, min/max, permissions, subcommands) changes the hash
+    payload = [
+        cmd.to_dict(bot.tree)
+        for cmd in sorted(bot.tree.get_commands(), key=lambda c: c.name)
+    ]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+async def sync_command_tree():
+    """
+    Sync slash commands with Discord at most once per process, and only
+    when the command definitions changed since the last recorded sync.
+    """
+    if getattr(bot, "_synced", False):
+        return
+
+    signature = command_tree_signature()
+    if load_data(SYNC_FILE, {}).get("signature") != signature:
+        try:
+            await bot.tree.sync()
+        except Exception as e:
+            print(f"[ERROR] Slash command sync failed: {e}")
+            return
+        save_data(SYNC_FILE, {"signature": signature})
+        print(f"🔁 Synced slash commands for {len(bot.tree.get_commands())} commands.")
+    else:
+        print("🔁 Slash commands unchanged — skipping sync.")
+
+    bot._synced = True
+
 # ============================================================
 # BOT EVENTS
 # ============================================================
 
+_sync_task: asyncio.Task | None = None  # held so the background sync isn't garbage-collected
+
 @bot.event
 async def on_ready():
-    normalize_dashboard_info()
-    normalize_all_facilities()
-    catch_up_tunnels()  # ✅ simulate supply loss while offline
-    await bot.tree.sync()
-    print(f"🔁 Synced slash commands for {len(bot.tree.get_commands())} commands.")
+    """Runs on first login and again after every gateway reconnect."""
+    global _sync_task
+    if _sync_task is None:  # one-time startup work
+        normalize_dashboard_info()
+        normalize_all_facilities()
+        invalidate_channel_index()  # normalization may have moved legacy channels
+        catch_up_tunnels()  # ✅ simulate supply loss while offline
+        # Sync in the background so a slow REST call doesn't hold up startup
+        _sync_task = asyncio.create_task(sync_command_tree())
     print(f"✅ Logged in as {bot.user}")
-    weekly_leaderboard.start()
-    refresh_dashboard_loop.start()
-    refresh_orders_loop.start()
-    flush_log_buffer.start()
+
+    for loop in (
+        weekly_leaderboard,
+        refresh_dashboard_loop,
+        refresh_orders_loop,
+        flush_log_buffer,
+        flush_saves_loop,
+        compact_orders_loop,
+    ):
+        if not loop.is_running():
+            loop.start()
 
 
 # ============================================================
@@ -1654,11 +2232,11 @@ async def on_ready():
 # ============================================================
 
 @bot.tree.command(name="addtunnel", description="Add a new tunnel.")
+@with_now
 async def addtunnel(interaction: discord.Interaction, name: str, total_supplies: int, usage_rate: int, location: str = "Unknown"):
     await interaction.response.defer(ephemeral=True)
 
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission to use this command.", ephemeral=True)
         return    
 
@@ -1690,9 +2268,10 @@ async def addtunnel(interaction: discord.Interaction, name: str, total_supplies:
         "total_supplies": total_supplies,
         "usage_rate": usage_rate,
         "location": location,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": utc_now().isoformat(),
+        "last_updated_ts": utc_now().timestamp(),
     }
-    save_data(DATA_FILE, tunnels)
+    mark_dirty(DATA_FILE, tunnels)
 
     if guild_id not in dashboard_info:
         dashboard_info[guild_id] = {}
@@ -1702,7 +2281,7 @@ async def addtunnel(interaction: discord.Interaction, name: str, total_supplies:
     fac_cfg = facilities.get(facility_name)
     if not fac_cfg or not fac_cfg.get("tunnel_message"):
         # First dashboard instance for this facility: create and store it
-        paginator = DashboardPaginator(fac_tunnels, facility_name=facility_name)
+        paginator = get_dashboard_view(guild_id, facility_name, fac_tunnels)
         msg = await interaction.followup.send(embed=paginator.build_page_embed(), view=paginator)
 
         facilities[facility_name] = {
@@ -1711,7 +2290,8 @@ async def addtunnel(interaction: discord.Interaction, name: str, total_supplies:
         }
         info["facilities"] = facilities
         dashboard_info[guild_id] = info
-        save_data(DASH_FILE, dashboard_info)
+        invalidate_channel_index(guild_id)
+        mark_dirty(DASH_FILE, dashboard_info)
     else:
         await log_action(
             interaction.guild,
@@ -1729,6 +2309,7 @@ async def addtunnel(interaction: discord.Interaction, name: str, total_supplies:
         )
 
 @bot.tree.command(name="addsupplies", description="Add supplies to a tunnel and record contribution.")
+@with_now
 async def addsupplies(interaction: discord.Interaction, name: str, amount: int):
     await interaction.response.defer(ephemeral=True)
     
@@ -1761,11 +2342,11 @@ async def addsupplies(interaction: discord.Interaction, name: str, amount: int):
 
     tdata["total_supplies"] = tdata.get("total_supplies", 0) + amount
     uid = str(interaction.user.id)
-    users[uid] = users.get(uid, 0) + amount
+    users[uid] += amount
 
-    save_data(DATA_FILE, tunnels)
-    save_data(USER_FILE, users)
-    await refresh_dashboard(interaction.guild, facility_name)
+    mark_dirty(DATA_FILE, tunnels)
+    mark_dirty(USER_FILE, users)
+    schedule_dashboard_refresh(interaction.guild, facility_name)
 
     log_contribution(interaction.user.id, "add supplies", amount, name)
     await log_action(
@@ -1790,9 +2371,8 @@ async def updatetunnel(interaction: discord.Interaction):
 
     # 1️⃣ Permission check FIRST (before any response)
     member = interaction.guild.get_member(interaction.user.id)
-    allowed_roles = {"Officer", "NCO", "Facility Specialist"}
 
-    if not member or not any(r.name in allowed_roles for r in member.roles):
+    if not is_tunnel_manager(member):
         await interaction.response.send_message(
             "🚫 You do not have permission to use this command.",
             ephemeral=True
@@ -1835,9 +2415,7 @@ async def msupp_dashboard(interaction: discord.Interaction):
         )
         return
 
-    allowed_role_names = {"Officer", "NCO", "Facility Specialist"}
-
-    if not any(role.name in allowed_role_names for role in member.roles):
+    if not is_tunnel_manager(member):
         await interaction.followup.send(
             "🚫 You do not have permission to use this command.",
             ephemeral=True
@@ -1847,7 +2425,7 @@ async def msupp_dashboard(interaction: discord.Interaction):
     # If this channel is already bound to a facility, refresh only that one
     existing_facility_name = get_facility_for_channel(guild_id, channel_id)
     if existing_facility_name:
-        await refresh_msupp_dashboard(guild, existing_facility_name)
+        await refresh_msupp_dashboard(guild, existing_facility_name, force=True)
         await interaction.response.send_message(
             f"🔁 Refreshed MSUPP dashboard for **{existing_facility_name}**.",
             ephemeral=True
@@ -1863,27 +2441,39 @@ async def msupp_dashboard(interaction: discord.Interaction):
 async def order_dashboard(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
 
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission to use this command.", ephemeral=True)
         return
 
     guild_id = str(interaction.guild_id)
-    embed = build_order_dashboard()
 
     if guild_id in dashboard_info and "orders_message" in dashboard_info[guild_id]:
         await refresh_order_dashboard(interaction.guild)
         await interaction.followup.send("🔁 Order dashboard refreshed.", ephemeral=True)
         return
 
-    msg = await interaction.followup.send(embed=embed)
+    # The posted dashboard is itself the confirmation — no second followup needed
+    msg = await interaction.followup.send(embed=build_order_dashboard())
     if guild_id not in dashboard_info:
         dashboard_info[guild_id] = {}
     dashboard_info[guild_id]["orders_channel"] = msg.channel.id
     dashboard_info[guild_id]["orders_message"] = msg.id
-    save_data(DASH_FILE, dashboard_info)
+    mark_dirty(DASH_FILE, dashboard_info)
+
+LEADERBOARD_MEDALS = ("🥇", "🥈", "🥉")  # top 3 positions
+
+
+def format_leaderboard_lines(top: list[tuple[str, int]]) -> list[str]:
+    """
+    One line per contributor. Users appear as mentions, which Discord renders
+    as display names client-side (without pinging, inside embeds), so no
+    user lookups are needed.
+    """
+    return [
+        f"{LEADERBOARD_MEDALS[i] if i < 3 else f'**{i+1}.**'} <@{uid}> — **{amt:,}**"
+        for i, (uid, amt) in enumerate(top)
+    ]
 
-    await interaction.followup.send("✅ Order dashboard created and bound to this channel.", ephemeral=True)
 
 @bot.tree.command(name="leaderboard", description="Show current contributors.")
 async def leaderboard(interaction: discord.Interaction):
@@ -1894,18 +2484,8 @@ async def leaderboard(interaction: discord.Interaction):
             await interaction.followup.send("No contributions yet!", ephemeral=True)
             return
 
-        top = sorted(users.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        # Medal emojis for top 3 positions
-        medals = ["🥇", "🥈", "🥉"]
-
-        desc_lines = []
-        for i, (uid, amt) in enumerate(top):
-            user = await bot.fetch_user(int(uid))
-            medal = medals[i] if i < 3 else f"**{i+1}.**"
-            desc_lines.append(f"{medal} {user.display_name} — **{amt:,}**")
-
-        desc = "\n".join(desc_lines) or "No contributions recorded."
+        top = users.most_common(10)
+        desc = "\n".join(format_leaderboard_lines(top)) or "No contributions recorded."
 
         embed = discord.Embed(
             title="🏆 Supply Leaderboard",
@@ -1919,12 +2499,9 @@ async def leaderboard(interaction: discord.Interaction):
         channel = interaction.channel
         await channel.send("⚠️ Interaction expired — here's the current leaderboard:")
 
-        sorted_users = sorted(users.items(), key=lambda x: x[1], reverse=True)
+        top = users.most_common(10)
         desc = "\n".join(
-            [
-                f"**{i+1}.** {(await bot.fetch_user(int(uid))).display_name} — {amt:,} supplies"
-                for i, (uid, amt) in enumerate(sorted_users[:10])
-            ]
+            [f"**{i+1}.** <@{uid}> — {amt:,} supplies" for i, (uid, amt) in enumerate(top)]
         )
         embed = discord.Embed(
             title="🏆 Supply Leaderboard",
@@ -1973,9 +2550,7 @@ async def deletetunnel(interaction: discord.Interaction, name: str):
         )
         return
 
-    allowed_role_names = {"Officer", "NCO", "Facility Specialist"}
-
-    if not any(role.name in allowed_role_names for role in member.roles):
+    if not is_tunnel_manager(member):
         await interaction.followup.send(
             "🚫 You do not have permission to use this command.",
             ephemeral=True
@@ -2012,8 +2587,8 @@ async def deletetunnel(interaction: discord.Interaction, name: str):
         
     # Remove from its facility
     facility_record["tunnels"].pop(name, None)
-    save_data(DATA_FILE, tunnels)
-    await refresh_dashboard(interaction.guild, facility_name)
+    mark_dirty(DATA_FILE, tunnels)
+    schedule_dashboard_refresh(interaction.guild, facility_name)
 
     await log_action(
         interaction.guild,
@@ -2035,11 +2610,12 @@ async def deletetunnel_name_autocomplete(
     return await tunnel_name_autocomplete_impl(interaction, current)
 
 @bot.tree.command(name="endwar", description="Officer-only: End the war, close all MSUPP facilities, and reset systems.")
+@with_now
 async def endwar(interaction: discord.Interaction):
+    global orders_data
     await interaction.response.defer(ephemeral=True)
 
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission.", ephemeral=True)
         return
         
@@ -2047,20 +2623,20 @@ async def endwar(interaction: discord.Interaction):
 # 1️⃣ ARCHIVE SNAPSHOT BEFORE RESET
 # ============================================================
 
-    war_end_time = datetime.now(timezone.utc)
+    war_end_time = utc_now()
     timestamp_str = war_end_time.strftime("%Y-%m-%d_%H-%M-%S_UTC")
     archive_folder = create_war_archive_folder(timestamp_str)
 
     # Save current state
     export_json(archive_folder / "tunnels.json", tunnels)
     export_json(archive_folder / "dashboard.json", dashboard_info)
-    export_json(archive_folder / "orders.json", load_data(ORDERS_FILE, {}))
+    export_json(archive_folder / "orders.json", orders_data)
     export_json(archive_folder / "users.json", users)
     export_json(archive_folder / "contributions.json", contributions)
 
     # Build summary before reset
     total_supplies = sum(users.values())
-    sorted_contribs = sorted(users.items(), key=lambda x: x[1], reverse=True)
+    sorted_contribs = users.most_common()
     facility_count = len(tunnels)
     tunnel_count = sum(len(f.get("tunnels", {})) for f in tunnels.values())
 
@@ -2097,10 +2673,8 @@ async def endwar(interaction: discord.Interaction):
     # Total supplies delivered overall
     total_supplies = sum(total_contribs.values())
 
-    # Sort users for leaderboard
-    sorted_contribs = sorted(
-        total_contribs.items(), key=lambda x: x[1], reverse=True
-    )
+    # Top ten for the leaderboard (no full sort needed)
+    top_contribs = heapq.nlargest(10, total_contribs.items(), key=operator.itemgetter(1))
 
     # Facility/tunnel counts
     facility_count = len(tunnels)
@@ -2109,7 +2683,7 @@ async def endwar(interaction: discord.Interaction):
     # Build summary lines
     leaderboard_lines = []
     rank = 1
-    for uid, amount in sorted_contribs[:10]:
+    for uid, amount in top_contribs:
         member = guild.get_member(int(uid))
         name = member.display_name if member else f"User {uid}"
         leaderboard_lines.append(f"**{rank}. {name}** — {amount:,}")
@@ -2136,7 +2710,7 @@ async def endwar(interaction: discord.Interaction):
             continue
 
         try:
-            msg = await channel.fetch_message(msg_id)
+            msg = channel.get_partial_message(msg_id)
             closed_embed = discord.Embed(
                 title="🛑 Facility Closed — End of War",
                 description=(
@@ -2155,10 +2729,14 @@ async def endwar(interaction: discord.Interaction):
 
     tunnels.clear()
     info["facilities"] = {}
+    invalidate_channel_index(guild_id)
+    for key in [k for k in _dashboard_views if k[0] == guild_id]:
+        del _dashboard_views[key]
+        _rendered_signatures.pop(key, None)
     dashboard_info[guild_id] = info
 
-    save_data(DATA_FILE, tunnels)
-    save_data(DASH_FILE, dashboard_info)
+    mark_dirty(DATA_FILE, tunnels)
+    mark_dirty(DASH_FILE, dashboard_info)
 
     # ============================================================
     # 4️⃣ RESET CONTRIBUTIONS (BUT KEEP USERS)
@@ -2169,15 +2747,14 @@ async def endwar(interaction: discord.Interaction):
 
     contributions.clear()
 
-    save_data(USER_FILE, users)
-    save_data(CONTRIB_FILE, contributions)
+    mark_dirty(USER_FILE, users)
+    mark_dirty(CONTRIB_FILE, contributions)
 
     # ============================================================
     # 5️⃣ WIPE ACTIVE ORDERS — PRESERVE ORDER DASHBOARD
     # ============================================================
 
     # Reset all active orders but keep the dashboard location
-    global orders_data
     orders_data = {"next_id": 1, "orders": {}}
     save_orders()
 
@@ -2185,8 +2762,8 @@ async def endwar(interaction: discord.Interaction):
         chan = guild.get_channel(info["orders_channel"])
         if chan:
             try:
-                msg = await chan.fetch_message(info["orders_message"])
-                view = OrderDashboardView()
+                msg = chan.get_partial_message(info["orders_message"])
+                view = get_order_dashboard_view(guild_id)
                 embed = build_clickable_order_dashboard()
                 await msg.edit(embed=embed, view=view)
             except Exception:
@@ -2211,7 +2788,7 @@ async def endwar(interaction: discord.Interaction):
     summary_embed = discord.Embed(
         title="🏁 End of War — Final MSUPP Summary",
         color=discord.Color.gold(),
-        timestamp=datetime.now(timezone.utc)
+        timestamp=war_end_time
     )
 
     summary_embed.add_field(name="🏭 Facilities Operated", value=str(facility_count), inline=True)
@@ -2236,22 +2813,21 @@ async def endwar(interaction: discord.Interaction):
 async def orders(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=False)
 
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission to use this command.", ephemeral=True)
         return
 
-    view = OrderDashboardView()
+    guild_id = str(interaction.guild_id)
+    view = get_order_dashboard_view(guild_id)
     embed = build_clickable_order_dashboard()
     msg = await interaction.followup.send(embed=embed, view=view)
 
-    guild_id = str(interaction.guild_id)
     if guild_id not in dashboard_info:
         dashboard_info[guild_id] = {}
 
     dashboard_info[guild_id]["orders_channel"] = msg.channel.id
     dashboard_info[guild_id]["orders_message"] = msg.id
-    save_data(DASH_FILE, dashboard_info)
+    mark_dirty(DASH_FILE, dashboard_info)
 
 @bot.tree.command(name="setleaderboardchannel", description="Set the channel where weekly leaderboards will be posted.")
 async def setleaderboardchannel(interaction: discord.Interaction, channel: discord.TextChannel):
@@ -2259,8 +2835,7 @@ async def setleaderboardchannel(interaction: discord.Interaction, channel: disco
     await interaction.response.defer(ephemeral=True)
 
     # Officer-only restriction
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission to use this command.", ephemeral=True)
         return
 
@@ -2270,7 +2845,7 @@ async def setleaderboardchannel(interaction: discord.Interaction, channel: disco
         dashboard_info[gid] = {}
 
     dashboard_info[gid]["leaderboard_channel"] = channel.id
-    save_data(DASH_FILE, dashboard_info)
+    mark_dirty(DASH_FILE, dashboard_info)
 
     await interaction.followup.send(
         f"✅ Weekly leaderboard channel set to {channel.mention}.",
@@ -2281,8 +2856,7 @@ async def setleaderboardchannel(interaction: discord.Interaction, channel: disco
 async def setlogchannel(interaction: discord.Interaction, channel: discord.TextChannel):
     await interaction.response.defer(ephemeral=True)
 
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission to use this command.", ephemeral=True)
         return
 
@@ -2291,12 +2865,13 @@ async def setlogchannel(interaction: discord.Interaction, channel: discord.TextC
         dashboard_info[guild_id] = {}
 
     dashboard_info[guild_id]["log_channel"] = channel.id
-    save_data(DASH_FILE, dashboard_info)
+    dashboard_info[guild_id].pop("log_thread", None)
+    mark_dirty(DASH_FILE, dashboard_info)
+    _log_thread_cache.pop(interaction.guild.id, None)
 
     await interaction.followup.send(f"✅ FAC logs will now post to {channel.mention}.", ephemeral=True)
 
-@bot.tree.command(name="help", description="Show all available Foxhole FAC commands.")
-async def help_command(interaction: discord.Interaction):
+def build_help_embed() -> discord.Embed:
     embed = discord.Embed(
         title="🛠️ Foxhole FAC Bot Commands",
         description="A complete list of available commands and their purposes.",
@@ -2376,14 +2951,19 @@ async def help_command(interaction: discord.Interaction):
     )
 
     embed.set_footer(text="Use /help anytime for a clean list of available commands.")
-    await interaction.response.send_message(embed=embed, ephemeral=True)    
+    return embed
+
+HELP_EMBED = build_help_embed()  # static content: built once, never mutated after this
+
+@bot.tree.command(name="help", description="Show all available Foxhole FAC commands.")
+async def help_command(interaction: discord.Interaction):
+    await interaction.response.send_message(embed=HELP_EMBED, ephemeral=True)
     
 @bot.tree.command(name="checkpermissions", description="Check the bot's permissions in this channel.")
 async def checkpermissions(interaction: discord.Interaction):
     await interaction.response.defer(ephemeral=True)
 
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission to use this command.", ephemeral=True)
         return
         
@@ -2406,6 +2986,7 @@ async def checkpermissions(interaction: discord.Interaction):
     amount="Positive or negative supply amount (e.g. -1500 or 500)",
     reason="Reason for the correction"
 )
+@with_now
 async def adjust_contribution(
     interaction: discord.Interaction,
     member: discord.Member,
@@ -2415,8 +2996,7 @@ async def adjust_contribution(
     await interaction.response.defer(ephemeral=True)
 
     # Officer check (explicit, consistent with other admin commands)
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send(
             "🚫 Only Officers can adjust contribution data.",
             ephemeral=True
@@ -2441,7 +3021,7 @@ async def adjust_contribution(
     contributions[user_id]["total_supplies"] = users[user_id]
 
     # Log correction action
-    now = datetime.now(timezone.utc).isoformat()
+    now = utc_now().isoformat()
     contributions[user_id]["actions"].append({
         "timestamp": now,
         "action": "correction",
@@ -2451,8 +3031,8 @@ async def adjust_contribution(
     })
 
     # Persist changes
-    save_data(USER_FILE, users)
-    save_data(CONTRIB_FILE, contributions)
+    mark_dirty(USER_FILE, users)
+    mark_dirty(CONTRIB_FILE, contributions)
 
     # FAC audit log
     await log_action(
@@ -2479,21 +3059,78 @@ async def adjust_contribution(
 # ORDERS SYSTEM
 # ============================================================
 
-def save_orders():
-    with open(ORDERS_FILE, "w") as f:
-        json.dump(orders_data, f, indent=4)
+_orders_version = 0  # bumped on every order mutation (see save_orders)
+
+def save_orders(order_id: str | None = None):
+    """
+    Persist an order mutation as one appended event instead of a full rewrite.
+    With `order_id`, records that order's current state (or its deletion);
+    without it, records a snapshot of all orders (e.g. the end-of-war reset).
+    """
+    global _orders_version
+    _orders_version += 1
+
+    if order_id is None:
+        event = {"op": "snapshot", "data": orders_data}
+    elif order_id in orders_data["orders"]:
+        event = {
+            "op": "set",
+            "id": order_id,
+            "order": orders_data["orders"][order_id],
+            "next_id": orders_data["next_id"],
+        }
+    else:
+        event = {"op": "delete", "id": order_id}
+    append_order_event(event)
+
+def compact_orders():
+    """Fold the event logs into ORDERS_FILE and truncate them (blocking; startup/shutdown)."""
+    if not any(
+        os.path.exists(path) and os.path.getsize(path)
+        for path in (ORDERS_LOG_FILE, ORDERS_LOG_ROTATED)
+    ):
+        return
+    save_data(ORDERS_FILE, orders_data)
+    open(ORDERS_LOG_FILE, "wb").close()
+    if os.path.exists(ORDERS_LOG_ROTATED):
+        os.remove(ORDERS_LOG_ROTATED)
+
+async def compact_orders_async():
+    """
+    Compaction without blocking the event loop: the snapshot is encoded and the
+    log rotated on the loop, so events appended while the thread writes land in
+    a fresh log that replays cleanly on top of the new snapshot.
+    """
+    if not os.path.exists(ORDERS_LOG_FILE) or os.path.getsize(ORDERS_LOG_FILE) == 0:
+        return
+    payload = encode_data(orders_data)
+    os.replace(ORDERS_LOG_FILE, ORDERS_LOG_ROTATED)
+    try:
+        await asyncio.to_thread(write_file, ORDERS_FILE, payload)
+    except Exception as e:
+        print(f"[SAVE ERROR] {ORDERS_FILE}: {e}")
+        # Put the rotated events back in front of anything appended meanwhile
+        if os.path.exists(ORDERS_LOG_FILE):
+            with open(ORDERS_LOG_FILE, "rb") as src, open(ORDERS_LOG_ROTATED, "ab") as dst:
+                dst.write(src.read())
+        os.replace(ORDERS_LOG_ROTATED, ORDERS_LOG_FILE)
+        return
+    os.remove(ORDERS_LOG_ROTATED)
 
 orders_data = load_orders()
+if os.path.exists(ORDERS_LOG_ROTATED):
+    compact_orders()  # finish what an interrupted compaction started
 
 # ------------------------------------------------------------
 # Create Order
 # ------------------------------------------------------------
 @bot.tree.command(name="order_create", description="Create a new order request.")
+@app_commands.choices(priority=[app_commands.Choice(name=p, value=p) for p in PRIORITY_ICONS])
+@with_now
 async def order_create(interaction: discord.Interaction, item: str, quantity: int, priority: str = "Normal", location: str = "Unknown"):
     await interaction.response.defer(ephemeral=True)
     
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 You do not have permission to create orders.", ephemeral=True)
         return
 
@@ -2503,15 +3140,15 @@ async def order_create(interaction: discord.Interaction, item: str, quantity: in
     orders_data["orders"][order_id] = {
         "item": item,
         "quantity": quantity,
-        "priority": priority.capitalize(),
-        "status": "Order Placed",
+        "priority": sys.intern(priority),
+        "status": sys.intern("Order Placed"),
         "requested_by": str(interaction.user.id),
         "claimed_by": None,
         "location": location,
-        "timestamps": {"created": datetime.now(timezone.utc).isoformat()},
+        "timestamps": {"created": utc_now().isoformat()},
     }
 
-    save_orders()
+    save_orders(order_id)
 
     await log_action(
         interaction.guild,
@@ -2532,8 +3169,7 @@ async def order_create(interaction: discord.Interaction, item: str, quantity: in
 async def order_delete(interaction: discord.Interaction, order_id: int):
     await interaction.response.defer(ephemeral=True)
 
-    officer_role = discord.utils.get(interaction.guild.roles, name="Officer")
-    if not officer_role or officer_role not in interaction.user.roles:
+    if not is_officer(interaction.guild, interaction.user):
         await interaction.followup.send("🚫 Only Officers can delete orders.", ephemeral=True)
         return
 
@@ -2543,7 +3179,7 @@ async def order_delete(interaction: discord.Interaction, order_id: int):
         return
 
     deleted = orders_data["orders"].pop(order_id)
-    save_orders()
+    save_orders(order_id)
 
     await log_action(
         interaction.guild,
@@ -2552,88 +3188,136 @@ async def order_delete(interaction: discord.Interaction, order_id: int):
         target_name=f"#{order_id}",
         details=f"{deleted['item']} x{deleted['quantity']}"
     )
-    
+
+    await refresh_order_dashboard(interaction.guild)
     await interaction.followup.send(f"🗑️ Order **#{order_id}** deleted successfully.", ephemeral=True)
 
 # ============================================================
 # TASKS
 # ============================================================
 
+DISCORD_CONCURRENCY = 10  # max per-guild Discord calls a task keeps in flight
+
+
+async def gather_limited(coros, limit: int = DISCORD_CONCURRENCY) -> list:
+    """asyncio.gather with at most `limit` running at once; exceptions are returned, not raised."""
+    sem = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=True)
+
+
+DRAIN_PERSIST_EVERY = 15  # ticks (30 minutes); catch_up_tunnels replays anything unsaved
+_drain_ticks = 0
+
 @tasks.loop(minutes=2)
+@with_now
 async def refresh_dashboard_loop():
+    global _drain_ticks
 # apply usage decay first (per facility, tolerant of malformed data)
-    for facility_name, facility_data in tunnels.items():
+    drained = False
+    stamp = utc_now().timestamp()
+    for facility_data in tunnels.values():
         tun_dict = facility_data.get("tunnels", {})
         if not isinstance(tun_dict, dict):
             continue
 
         for tdata in tun_dict.values():
             rate = tdata.get("usage_rate", 0)
-            if rate > 0:
+            supplies = tdata.get("total_supplies", 0)
+            if rate > 0 and supplies > 0:
                 # 2 minutes is 1/30th of an hour → rate/30
-                tdata["total_supplies"] = max(
-                    0,
-                    tdata.get("total_supplies", 0) - (rate / 30)
-                )
+                tdata["total_supplies"] = max(0, supplies - rate / 30)
+                drained = True
+            # Stamp every tunnel, drained or not: a refill or usage change
+            # saves this stamp, and catch_up_tunnels must not replay from an
+            # older one
+            tdata["last_updated_ts"] = stamp
+
+    # The drain only needs saving now and then: on restart catch_up_tunnels
+    # drains from each tunnel's saved last_updated_ts, covering unsaved ticks.
+    # This tick is not a catch-all save: every other change to `tunnels`
+    # (commands, buttons, modals) must mark DATA_FILE dirty itself.
+    if drained:
+        _drain_ticks += 1
+        if _drain_ticks % DRAIN_PERSIST_EVERY == 0:
+            mark_dirty(DATA_FILE, tunnels)
+
+    # update dashboards per facility; edits overlap on the network
+    targets = [
+        (guild, facility_name)
+        for guild in bot.guilds
+        for facility_name in dashboard_info.get(str(guild.id), {}).get("facilities", {})
+    ]
+    results = await gather_limited(
+        refresh_msupp_dashboard(guild, facility_name) for guild, facility_name in targets
+    )
+    for (guild, facility_name), result in zip(targets, results):
+        if isinstance(result, Exception):
+            print(f"[ERROR] Dashboard refresh failed for '{facility_name}' in {guild.name}: {result}")
 
-    save_data(DATA_FILE, tunnels)
+async def post_weekly_leaderboard(guild: discord.Guild, now: datetime):
+    """Post this week's top contributors to the guild's leaderboard channel."""
+    info = dashboard_info.get(str(guild.id), {})
+    channel = None
 
-    # update dashboards per facility
-    for guild in bot.guilds:
-        gid = str(guild.id)
-        info = dashboard_info.get(gid, {})
-        facilities = info.get("facilities", {})
-        for facility_name in facilities.keys():
-            await refresh_msupp_dashboard(guild, facility_name)
+    # Check if custom channel is set
+    if "leaderboard_channel" in info:
+         channel = guild.get_channel(info["leaderboard_channel"])
+
+    # Fallback if not set or missing
+    if not channel:
+         channel = discord.utils.get(guild.text_channels, name="logistics") or \
+               discord.utils.get(guild.text_channels, name="general")
+
+    if not channel:
+        return
+    if not users:
+        await channel.send("📊 No contributions to report this week!")
+        return
+    top = users.most_common(10)
+    desc = "\n".join(format_leaderboard_lines(top)) or "No contributions recorded."
+
+    embed = discord.Embed(
+        title="🏆 Weekly Contribution Leaderboard",
+        description=desc,
+        color=0xFFD700,
+        timestamp=now,
+    )
+    embed.set_footer(text=f"Updated {now.strftime('%Y-%m-%d %H:%M UTC')}")
+    await channel.send(embed=embed)
 
 @tasks.loop(time=time(hour=12, tzinfo=timezone.utc))
 async def weekly_leaderboard():
     now = datetime.now(timezone.utc)
     if now.weekday() != 6:
         return
-    for guild in bot.guilds:
-        info = dashboard_info.get(str(guild.id), {})
-        channel = None
-
-        # Check if custom channel is set
-        if "leaderboard_channel" in info:
-             channel = guild.get_channel(info["leaderboard_channel"])
-
-        # Fallback if not set or missing
-        if not channel:
-             channel = discord.utils.get(guild.text_channels, name="logistics") or \
-                   discord.utils.get(guild.text_channels, name="general")
-
-        if not channel:
-            continue
-        if not users:
-            await channel.send("📊 No contributions to report this week!")
-            continue
-        top = sorted(users.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        # Medal emojis for top 3 positions
-        medals = ["🥇", "🥈", "🥉"]
-
-        desc_lines = []
-        for i, (uid, amt) in enumerate(top):
-            user = await bot.fetch_user(int(uid))
-            medal = medals[i] if i < 3 else f"**{i+1}.**"
-            desc_lines.append(f"{medal} {user.display_name} — **{amt:,}**")
-
-        desc = "\n".join(desc_lines) or "No contributions recorded."
-
-        embed = discord.Embed(
-            title="🏆 Weekly Contribution Leaderboard",
-            description=desc,
-            color=0xFFD700,
-            timestamp=now,
-        )
-        embed.set_footer(text=f"Updated {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
-        await channel.send(embed=embed)
+    guilds = list(bot.guilds)
+    results = await gather_limited(post_weekly_leaderboard(guild, now) for guild in guilds)
+    for guild, result in zip(guilds, results):
+        if isinstance(result, Exception):
+            print(f"[ERROR] Weekly leaderboard failed in {guild.name}: {result}")
     # Reset weekly totals but keep user entries for war/lifetime stats
     for uid in list(users.keys()):
         users[uid] = 0
-    save_data(USER_FILE, users)
+    mark_dirty(USER_FILE, users)
+
+@tasks.loop(seconds=2)
+async def flush_saves_loop():
+    """Write files queued via mark_dirty(); encode here, write off the event loop."""
+    while _pending_saves:
+        file, data = _pending_saves.popitem()
+        try:
+            await asyncio.to_thread(write_file, file, encode_data(data))
+        except Exception as e:
+            print(f"[SAVE ERROR] {file}: {e}")
+
+@tasks.loop(minutes=10)
+async def compact_orders_loop():
+    await compact_orders_async()
 
 @tasks.loop(minutes=5)
 async def flush_log_buffer():
@@ -2648,3 +3332,5 @@ async def before_flush_supply():
 # ============================================================
 
 bot.run(TOKEN)
+flush_pending_saves()  # persist anything still queued at shutdown
+compact_orders()
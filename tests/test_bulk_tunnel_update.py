@@ -0,0 +1,66 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+discord = pytest.importorskip("discord")
+
+BOT_PATH = Path(__file__).resolve().parent.parent / "foxhole_fac_bot.py"
+
+
+@pytest.fixture
+def bot_module(tmp_path, monkeypatch):
+    """Import the bot with its data files in tmp_path and without connecting."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DISCORD_TOKEN", "test-token")
+    monkeypatch.setattr(discord.Client, "run", lambda *args, **kwargs: None)
+    spec = importlib.util.spec_from_file_location("foxhole_fac_bot", BOT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_interaction(user):
+    sent = []
+
+    async def send_message(content=None, **kwargs):
+        sent.append(content)
+
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=1, name="Test Guild"),
+        user=user,
+        response=SimpleNamespace(send_message=send_message),
+        sent=sent,
+    )
+
+
+def test_bulk_update_is_saved_to_data_file(bot_module):
+    bot = bot_module
+    bot.tunnels.clear()
+    bot.tunnels["Alpha"] = {"tunnels": {
+        "CT-1": {"total_supplies": 100, "usage_rate": 10},
+        "CT-2": {"total_supplies": 200, "usage_rate": 0},
+    }}
+    user = SimpleNamespace(id=42, display_name="Tester", mention="<@42>")
+
+    async def submit():
+        modal = bot.BulkTunnelUpdateModal("Alpha", user)
+        modal.lines._value = "CT-1, 5000, 250\nCT-2, 900\nCT-9, 1"
+        interaction = make_interaction(user)
+        await modal.on_submit(interaction)
+        return interaction
+
+    interaction = asyncio.run(submit())
+    assert "Updated: CT-1, CT-2" in interaction.sent[0]
+
+    bot.flush_pending_saves()
+    saved = bot.load_data(bot.DATA_FILE, {})
+
+    assert set(saved) == {"Alpha"}  # whole tunnels dict, not one facility
+    ct1 = saved["Alpha"]["tunnels"]["CT-1"]
+    ct2 = saved["Alpha"]["tunnels"]["CT-2"]
+    assert (ct1["total_supplies"], ct1["usage_rate"]) == (5000, 250)
+    assert (ct2["total_supplies"], ct2["usage_rate"]) == (900, 0)
+    assert ct1["last_updated_by"] == "42"